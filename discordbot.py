@@ -1,57 +1,366 @@
 import discord
 from discord.ext import commands
 import os
+import sys
 import json
 import datetime
+import time
 import asyncio
 import argparse
 import textwrap
-from typing import Dict, List, Any, Optional, TextIO
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import re
+import functools
+import heapq
+import operator
+import itertools
+import mmap
+from typing import Dict, List, Any, Iterator, Optional, Tuple, TypedDict, Union
+
+try:
+    import orjson  # Optional: much faster JSON parsing for large exports
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec  # Optional: decodes only the message fields this tool reads
+except ImportError:
+    msgspec = None
+
+try:
+    import ijson  # Optional: streams messages out of huge exports in local mode
+except ImportError:
+    ijson = None
 
 # Configuration
 TOKEN_FILE = "config.json"  # Where the bot token is stored
 DEFAULT_JSON_FILE = "messages.json"  # Default file containing Discord messages
 BATCH_SIZE = 5  # Reduced batch size to avoid rate limits
-DELAY_BETWEEN_MESSAGES = 0.25  # Add delay between individual messages
 MAX_RATE = 5  # Much more conservative rate limit
+MAX_SEND_RETRIES = 3  # Retries for a message that hit a rate limit
 DEFAULT_PREFIX = "!"  # Command prefix for bot commands
+OUTPUT_BUFFER_SIZE = 1 << 20  # Buffer size for local mode output files
+MESSAGES_PER_WRITE = 256  # Rendered messages joined into each write in local mode
+RENDER_CHUNK_SIZE = 1024  # Messages rendered per worker task in local mode
+PARALLEL_RENDER_MIN = 20000  # Smaller exports are rendered without worker processes
+STREAM_BATCH_SIZE = 10000  # Streamed messages filtered at a time in local mode
+INDENT = "     "  # Indent for attachment URLs and embed details in local mode
+
+# Parsed exports keyed by absolute path, reused while the file's (mtime_ns, size) is unchanged
+_MSG_CACHE: Dict[str, Tuple[Tuple[int, int], List[Dict[str, Any]]]] = {}
+# Timestamp-sorted copies of the cached exports, keyed by path and tied to the parsed list
+_SORTED_CACHE: Dict[str, Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]] = {}
+# Author indexes of the sorted exports, keyed by path and tied to the sorted list
+_AUTHOR_INDEX_CACHE: Dict[str, Tuple[List[Dict[str, Any]], Dict[Tuple[Any, Any], List[int]]]] = {}
+
+# Sort key for messages, equivalent to `lambda m: m.get('timestamp', '')` but implemented in C.
+# Discord timestamps are fixed-layout ISO-8601 strings, so sorting them as plain strings is
+# chronological and they never need to be parsed. itemgetter would raise on a missing timestamp.
+_timestamp_key = operator.methodcaller('get', 'timestamp', '')
+
+# Options accepted by the !post command, e.g. "reverse filter:alice search: hello"
+_OPTS_RE = re.compile(r'filter:\s*(?P<user>\S+)|search:\s*(?P<search>\S+)|(?P<reverse>reverse)', re.IGNORECASE)
+
+_fromisoformat = datetime.datetime.fromisoformat
 
 def format_timestamp(timestamp: str) -> str:
     """Format the Discord timestamp to a readable format."""
+    if not isinstance(timestamp, str):
+        # Can't be parsed (or cached), so it is shown as is
+        return timestamp
+    return _format_timestamp(timestamp)
+
+@functools.lru_cache(maxsize=1 << 16)
+def _format_timestamp(timestamp: str) -> str:
     try:
         # Discord timestamps look like: "2023-01-01T12:34:56.789+00:00"
-        dt = datetime.datetime.fromisoformat(timestamp)
-        return dt.strftime("%Y-%m-%d %H:%M:%S")
+        dt = _fromisoformat(timestamp)
     except Exception:
         return timestamp
+    
+    # Once parsing has validated it, the readable form of the usual layout is a slice
+    # of the string, which is much cheaper than strftime. Years before 1000 and 24:00
+    # (accepted by newer Pythons) print differently, so they still go through strftime.
+    if (len(timestamp) >= 19 and timestamp[4] == '-' and timestamp[7] == '-' and timestamp[10] in 'T '
+            and timestamp[13] == ':' and timestamp[16] == ':'
+            and timestamp[0] != '0' and timestamp[11:13] != '24'):
+        return timestamp[:10] + ' ' + timestamp[11:19]
+    return dt.strftime("%Y-%m-%d %H:%M:%S")
+
+_UNKNOWN_USER = 'Unknown User'
+
+def _author_of(message: Dict[str, Any]) -> str:
+    """Get a message's author name, preferring global_name over username."""
+    author = message.get('author')
+    if not author:
+        return _UNKNOWN_USER
+    return author.get('global_name') or author.get('username') or _UNKNOWN_USER
+
+def format_message(message: Dict[str, Any]) -> str:
+    """Format a message as the single line of text posted to Discord."""
+    author_name = _author_of(message)
+    timestamp = format_timestamp(message.get('timestamp', ''))
+    prefix = ''.join(("[", timestamp, "] ", author_name, ": "))
+    
+    # Discord has a 2000 character limit, so trim long content before building the text
+    content = message.get('content') or ''
+    room = max(2000 - len(prefix), 0)
+    if len(content) > room:
+        content = content[:room]
+    return prefix + content
+
+@functools.lru_cache(maxsize=8)
+def _text_wrapper(width: int) -> textwrap.TextWrapper:
+    """Get a shared TextWrapper for the given width."""
+    return textwrap.TextWrapper(width=width)
+
+# Whitespace other than a plain space (tabs, NBSP, U+3000, ...). TextWrapper expands or
+# splits on some of these and drops chunks made only of them, so such lines take the slow path
+_OTHER_WHITESPACE_RE = re.compile(r'[^\S ]')
+
+def _wrap_line(line: str, width: int) -> List[str]:
+    """
+    Wrap a single line exactly like TextWrapper does.
+    Plain single-spaced text whose words all fit is split with str.rfind;
+    anything else (hyphens, other whitespace, runs of spaces, over-long words) goes through textwrap.
+    """
+    if (line[0] == ' ' or line[-1] == ' ' or '  ' in line or '-' in line
+            or _OTHER_WHITESPACE_RE.search(line)
+            or max(map(len, line.split(' '))) > width):
+        return _text_wrapper(width).wrap(line)
+    
+    lines = []
+    while len(line) > width:
+        k = line.rfind(' ', 0, width + 1)
+        lines.append(line[:k])
+        line = line[k + 1:]
+    lines.append(line)
+    return lines
 
 def wrap_text(text: str, width: int = 80) -> str:
     """Wrap text to a specified width."""
     if not text:
         return ""
     
+    # Most Discord messages already fit, so there is nothing to wrap
+    if len(text) <= width:
+        return text
+    
     lines = []
     for line in text.split('\n'):
         if len(line) <= width:
             lines.append(line)
         else:
-            wrapped = textwrap.wrap(line, width=width)
-            lines.extend(wrapped)
+            lines.extend(_wrap_line(line, width))
     
     return '\n'.join(lines)
 
+# Message fields read by this tool. msgspec decodes exports against this shape,
+# so unused fields (mentions, flags, ...) are never turned into Python objects.
+class _AuthorFields(TypedDict, total=False):
+    username: Optional[str]
+    global_name: Optional[str]
+
+class _AttachmentFields(TypedDict, total=False):
+    url: Optional[str]
+    filename: Optional[str]
+
+class _EmbedFields(TypedDict, total=False):
+    title: Optional[str]
+    url: Optional[str]
+    description: Optional[str]
+
+class _EmojiFields(TypedDict, total=False):
+    name: Optional[str]
+
+class _ReactionFields(TypedDict, total=False):
+    emoji: _EmojiFields
+    count: int
+
+class _MessageFields(TypedDict, total=False):
+    author: _AuthorFields
+    content: Optional[str]
+    timestamp: str
+    attachments: List[_AttachmentFields]
+    embeds: List[_EmbedFields]
+    reactions: List[_ReactionFields]
+
+class _ExportFields(TypedDict, total=False):
+    messages: List[_MessageFields]
+
+_export_decoder = msgspec.json.Decoder(Union[List[_MessageFields], _ExportFields]) if msgspec else None
+
+def read_json(f) -> Any:
+    """
+    Parse JSON from a file opened in binary mode.
+    Uses msgspec or orjson on a memory map of the file when available.
+    """
+    if (msgspec is None and orjson is None) or os.fstat(f.fileno()).st_size == 0:
+        return json.loads(f.read())
+    
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            if _export_decoder is not None:
+                try:
+                    data = _export_decoder.decode(view)
+                    if isinstance(data, list) or 'messages' in data:
+                        return data
+                except msgspec.MsgspecError:
+                    # Unexpected shape or invalid JSON, let the generic parser handle it
+                    pass
+            
+            if orjson is not None:
+                return orjson.loads(view)
+            return json.loads(bytes(view))
+
 def load_messages(file_path: str) -> List[Dict[str, Any]]:
     """
     Load messages from the JSON file.
-    Handles different Discord export formats.
+    The parsed list is cached until the file changes, so callers must not modify it.
     """
     if not os.path.exists(file_path):
         print(f"Error: File '{file_path}' not found.")
         return []
     
+    key = os.path.abspath(file_path)
+    st = os.stat(file_path)
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = _MSG_CACHE.get(key)
+    if cached and cached[0] == signature:
+        return cached[1]
+    
+    messages = parse_messages(file_path)
+    if messages:
+        _MSG_CACHE[key] = (signature, messages)
+    else:
+        _MSG_CACHE.pop(key, None)
+    return messages
+
+def load_sorted_messages(file_path: str) -> List[Dict[str, Any]]:
+    """
+    Load messages from the JSON file sorted by timestamp.
+    The sorted list is cached alongside the parsed one, so callers must not modify it.
+    """
+    messages = load_messages(file_path)
+    key = os.path.abspath(file_path)
+    cached = _SORTED_CACHE.get(key)
+    if cached and cached[0] is messages:
+        return cached[1]
+    
+    sorted_messages = sort_by_timestamp(messages)
+    if messages:
+        _SORTED_CACHE[key] = (messages, sorted_messages)
+    return sorted_messages
+
+def load_author_index(file_path: str, sorted_messages: List[Dict[str, Any]]) -> Dict[Tuple[Any, Any], List[int]]:
+    """
+    Map each (global_name, username) pair to the positions of its messages
+    in `sorted_messages`, the list returned by load_sorted_messages(file_path).
+    The index is cached alongside that list and rebuilt when the list changes.
+    """
+    key = os.path.abspath(file_path)
+    cached = _AUTHOR_INDEX_CACHE.get(key)
+    if cached and cached[0] is sorted_messages:
+        return cached[1]
+    
+    index: Dict[Tuple[Any, Any], List[int]] = {}
+    for i, message in enumerate(sorted_messages):
+        author = message.get('author') or {}
+        index.setdefault((author.get('global_name'), author.get('username')), []).append(i)
+    
+    if sorted_messages:
+        _AUTHOR_INDEX_CACHE[key] = (sorted_messages, index)
+    return index
+
+def sort_by_timestamp(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Sort messages by timestamp.
+    Exports are usually already chronological, in which case the same list is returned.
+    """
+    keys = list(map(_timestamp_key, messages))
+    if all(map(operator.le, keys, itertools.islice(keys, 1, None))):
+        return messages
+    return sorted(messages, key=_timestamp_key)
+
+def iter_messages(file_path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield messages from the JSON file one at a time.
+    Streams the file with ijson when it is installed, otherwise falls back to load_messages.
+    Raises ijson.JSONError if the streamed file turns out to be invalid part way through.
+    """
+    if ijson is None or not os.path.exists(file_path):
+        yield from load_messages(file_path)
+        return
+    
+    with open(file_path, 'rb') as f:
+        # Peek at the first non-whitespace byte to tell a list from an object
+        first = b''
+        while not first:
+            chunk = f.read(64)
+            if not chunk:
+                break
+            first = chunk.lstrip()[:1]
+        f.seek(0)
+        
+        prefix = {b'[': 'item', b'{': 'messages.item'}.get(first)
+        found = False
+        if prefix:
+            for message in ijson.items(f, prefix, use_float=True):
+                found = True
+                yield message
+    
+    # Other export layouts need the whole document to be inspected
+    if not found:
+        yield from load_messages(file_path)
+
+def filter_messages(messages: List[Dict[str, Any]], user: Optional[str] = None,
+                    search: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Filter messages by author name and/or content, ignoring case.
+    Each distinct author is lowercased and matched once, and content is only
+    lowercased for messages that passed the user filter.
+    """
+    if not user and not search:
+        return messages
+    
+    if user:
+        user_lower = user.lower()
+        author_matches: Dict[Tuple[Any, Any], bool] = {}
+        selected = []
+        for message in messages:
+            author = message.get('author') or {}
+            names = (author.get('global_name'), author.get('username'))
+            matched = author_matches.get(names)
+            if matched is None:
+                matched = author_matches[names] = (user_lower in (names[0] or '').lower()
+                                                   or user_lower in (names[1] or '').lower())
+            if matched:
+                selected.append(message)
+        messages = selected
+    
+    if search:
+        # A plain substring test on lowercased content is faster in CPython than
+        # an IGNORECASE regex, which can't use the fast literal search
+        search_lower = search.lower()
+        messages = [message for message in messages
+                    if search_lower in (message.get('content') or '').lower()]
+    
+    return messages
+
+# Fields other exporters commonly store the message list under
+_MESSAGE_LIST_KEYS = ('rows', 'data', 'records')
+# Fields every exported message has
+_MESSAGE_FIELDS = frozenset(('author', 'content', 'timestamp'))
+
+def parse_messages(file_path: str) -> List[Dict[str, Any]]:
+    """
+    Parse messages from the JSON file.
+    Handles different Discord export formats.
+    """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(file_path, 'rb') as f:
+            data = read_json(f)
             
             # Handle different JSON structures
             if isinstance(data, list):
@@ -60,22 +369,21 @@ def load_messages(file_path: str) -> List[Dict[str, Any]]:
             elif isinstance(data, dict):
                 # Check for known export formats
                 if 'messages' in data:
-                    # Standard Discord export format
-                    return data['messages']
-                elif 'channel' in data and 'messages' in data:
-                    # Another common format
+                    # Standard Discord export format (also used alongside 'channel' metadata)
                     return data['messages']
                 elif 'guild' in data and 'channels' in data:
                     # Guild export with multiple channels
                     print("Guild export detected with multiple channels. Please specify a channel export file.")
                     return []
                 else:
-                    # Try to find a list of messages in any field
-                    for key, value in data.items():
-                        if isinstance(value, list) and len(value) > 0 and isinstance(value[0], dict):
-                            if all(isinstance(item, dict) and 'author' in item and 'content' in item and 'timestamp' in item for item in value[:5]):
-                                print(f"Found messages in field '{key}'")
-                                return value
+                    # Try to find a list of messages, checking the usual field names first
+                    for key in (*_MESSAGE_LIST_KEYS, *data):
+                        value = data.get(key)
+                        # Every message in an export has the same shape, so probing the first is enough
+                        if (isinstance(value, list) and value and isinstance(value[0], dict)
+                                and value[0].keys() >= _MESSAGE_FIELDS):
+                            print(f"Found messages in field '{key}'")
+                            return value
                     
                     print("Unknown JSON structure. Please check the file format.")
                     return []
@@ -89,11 +397,13 @@ def load_messages(file_path: str) -> List[Dict[str, Any]]:
         print(f"Error loading messages: {str(e)}")
         return []
 
-def print_message(message: Dict[str, Any], width: int = 80, file: Optional[TextIO] = None) -> None:
-    """Print a single message in a readable format."""
+def render_message_into(message: Dict[str, Any], width: int, parts: List[str], separator: str) -> None:
+    """
+    Render a single message in a readable format, appending its text to `parts`.
+    `separator` is the line written after the message, built once by the caller.
+    """
     # Get author name (prefer global_name if available, otherwise username)
-    author = message.get('author', {})
-    author_name = author.get('global_name') or author.get('username') or 'Unknown User'
+    author_name = _author_of(message)
     
     # Get message content
     content = message.get('content', '')
@@ -102,51 +412,58 @@ def print_message(message: Dict[str, Any], width: int = 80, file: Optional[TextI
     # Get timestamp
     timestamp = format_timestamp(message.get('timestamp', ''))
     
-    # Print the message
-    print(f"[{timestamp}] {author_name}:", file=file)
+    # Render the message
+    parts.append("[%s] %s:\n" % (timestamp, author_name))
     if wrapped_content:
-        print(wrapped_content, file=file)
+        parts.append(f"{wrapped_content}\n")
     
     # Check for attachments
     attachments = message.get('attachments', [])
     if attachments:
-        print(f"  Attachments ({len(attachments)}):", file=file)
+        parts.append(f"  Attachments ({len(attachments)}):\n")
         for i, attachment in enumerate(attachments, 1):
             url = attachment.get('url', 'No URL')
             filename = attachment.get('filename', 'Unknown file')
-            print(f"  {i}. {filename}", file=file)
-            print(f"     {url}", file=file)
+            parts.append(f"  {i}. {filename}\n")
+            parts.append(f"{INDENT}{url}\n")
     
     # Check for embeds
     embeds = message.get('embeds', [])
     if embeds:
-        print(f"  Embeds ({len(embeds)}):", file=file)
+        parts.append(f"  Embeds ({len(embeds)}):\n")
         for i, embed in enumerate(embeds, 1):
             title = embed.get('title', 'No Title')
             url = embed.get('url', '')
             description = embed.get('description', '')
             
-            print(f"  {i}. {title}", file=file)
+            parts.append(f"  {i}. {title}\n")
             if url:
-                print(f"     URL: {url}", file=file)
+                parts.append(f"{INDENT}URL: {url}\n")
             if description:
                 wrapped_desc = wrap_text(description, width=width-5)
-                indented_desc = '\n'.join(f"     {line}" for line in wrapped_desc.split('\n'))
-                print(indented_desc, file=file)
+                parts.append(INDENT + wrapped_desc.replace('\n', '\n' + INDENT) + '\n')
     
     # Check for reactions
     reactions = message.get('reactions', [])
     if reactions:
-        reaction_str = "  Reactions: "
+        parts.append("  Reactions: ")
         for reaction in reactions:
             emoji = reaction.get('emoji', {})
             emoji_name = emoji.get('name', '')
             count = reaction.get('count', 0)
-            reaction_str += f"{emoji_name} ({count}) "
-        print(reaction_str, file=file)
+            parts.append(f"{emoji_name} ({count}) ")
+        parts.append("\n")
     
-    # Print a separator for readability
-    print("-" * width, file=file)
+    # Add a separator for readability
+    parts.append(separator)
+
+def _render_chunk(messages: List[Dict[str, Any]], width: int) -> str:
+    """Render a chunk of messages into a single string."""
+    parts: List[str] = []
+    separator = "-" * width + "\n"
+    for message in messages:
+        render_message_into(message, width, parts, separator)
+    return ''.join(parts)
 
 def load_config():
     """Load bot configuration from config.json file."""
@@ -165,6 +482,101 @@ def save_config(config):
     with open(TOKEN_FILE, 'w') as f:
         json.dump(config, f, indent=4)
 
+class SendPacer:
+    """Space outgoing requests at a fixed rate using a monotonic next-send time."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self.next_send = time.monotonic()
+
+    async def wait(self) -> None:
+        """Sleep until the next send is allowed, then book the slot after it."""
+        delay = self.next_send - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self.next_send = time.monotonic() + self.interval
+
+    def defer(self, seconds: float) -> None:
+        """Hold back the next send, e.g. for the Retry-After of a rate limit."""
+        self.next_send = max(self.next_send, time.monotonic() + seconds)
+
+def _retry_after(error: discord.errors.HTTPException) -> float:
+    """Seconds Discord asked us to wait after a 429, defaulting to one second."""
+    headers = getattr(getattr(error, 'response', None), 'headers', None) or {}
+    try:
+        return float(headers.get('Retry-After', 1.0))
+    except (TypeError, ValueError):
+        return 1.0
+
+async def _send_one(channel, text: str, pacer: SendPacer) -> bool:
+    """Send a single message, waiting out a rate limit before retrying."""
+    for attempt in range(MAX_SEND_RETRIES + 1):
+        await pacer.wait()
+        try:
+            await channel.send(text[:2000])  # Discord has a 2000 character limit
+            return True
+        except discord.errors.HTTPException as e:
+            if e.status == 429 and attempt < MAX_SEND_RETRIES:
+                print("Rate limited. Waiting and retrying...")
+                pacer.defer(_retry_after(e))
+                continue
+            print(f"❌ Failed to send message: {text[:50]}... ({e})")
+            return False
+        except Exception as e:
+            print(f"❌ Error posting message: {str(e)}")
+            return False
+    return False
+
+async def send_messages(channel, texts: List[str]) -> int:
+    """
+    Send pre-formatted messages to a channel one at a time, at most MAX_RATE per second.
+    Each send is awaited before the next one starts, so messages arrive in order
+    and a rate-limit retry holds back every later message.
+    Returns the number of messages that were sent successfully.
+    """
+    total_messages = len(texts)
+    pacer = SendPacer(MAX_RATE)
+    start_time = time.monotonic()
+    last_update_time = start_time
+    last_flush_time = start_time
+    sent = 0
+
+    try:
+        for completed, msg_text in enumerate(texts, 1):
+            if await _send_one(channel, msg_text, pacer):
+                sent += 1
+
+            # Update time estimates more frequently - every message multiple of 20 or every 30 seconds
+            current_time = time.monotonic()
+
+            if completed % 20 == 0 or completed == total_messages or current_time - last_update_time >= 30:
+                progress = completed
+                elapsed = current_time - start_time
+                rate = progress / elapsed if elapsed > 0 else 0
+                percentage = (progress / total_messages) * 100
+
+                # Update time estimates
+                remaining_messages = total_messages - progress
+                remaining_time = remaining_messages / rate if rate > 0 else 0
+                new_eta = datetime.datetime.now() + datetime.timedelta(seconds=remaining_time)
+
+                # Only print to console, don't send to Discord, as a single write
+                sys.stdout.write(
+                    f"Posted {progress}/{total_messages} messages ({percentage:.1f}%, {rate:.1f} msgs/sec)\n"
+                    f"Estimated time remaining: {str(datetime.timedelta(seconds=int(remaining_time))).split('.')[0]}\n"
+                    f"New ETA: {new_eta.strftime('%H:%M:%S')}\n"
+                )
+                if current_time - last_flush_time >= 1.0:
+                    sys.stdout.flush()
+                    last_flush_time = current_time
+
+                # Update the last update time
+                last_update_time = current_time
+    finally:
+        sys.stdout.flush()
+
+    return sent
+
 # Initialize the bot with intents
 intents = discord.Intents.default()
 intents.message_content = True  # Required to read message content
@@ -185,13 +597,13 @@ async def on_ready():
     print('Or run the auto-post mode by providing channel ID as command line argument')
     
     # Check if we should auto-post based on command line arguments
-    if hasattr(bot, 'auto_post_channel_id') and bot.auto_post_channel_id:
+    if getattr(bot, 'auto_post_channel_id', None):
         channel = bot.get_channel(bot.auto_post_channel_id)
         if channel:
             print(f"\nAuto-posting messages to #{channel.name}...")
             
             # Ask about deleting all messages in channel
-            if hasattr(bot, 'delete_all_messages') and bot.delete_all_messages:
+            if getattr(bot, 'delete_all_messages', False):
                 await delete_all_channel_messages(channel)
                 
             await auto_post_messages(channel, 
@@ -228,60 +640,45 @@ async def post_command(ctx, limit: int = None, *, options: str = ""):
     filter_user = None
     search_term = None
     
-    if "reverse" in options.lower():
-        reverse = True
-    
-    if "filter:" in options.lower():
-        parts = options.lower().split("filter:")
-        if len(parts) > 1:
-            filter_user = parts[1].split()[0].strip()
-    
-    if "search:" in options.lower():
-        parts = options.lower().split("search:")
-        if len(parts) > 1:
-            search_term = parts[1].split()[0].strip()
+    # The first filter: and search: win if an option is repeated
+    for match in _OPTS_RE.finditer(options):
+        if match.group('user'):
+            filter_user = filter_user or match.group('user').lower()
+        elif match.group('search'):
+            search_term = search_term or match.group('search').lower()
+        else:
+            reverse = True
     
-    # Load messages from messages.json
-    messages = load_messages("messages.json")
+    # Load messages from messages.json, already sorted by timestamp
+    sorted_messages = load_sorted_messages("messages.json")
     
-    if not messages:
+    if not sorted_messages:
         await ctx.send("❌ No messages found in messages.json or error loading file.")
         return
     
-    # Sort messages by timestamp
-    sorted_messages = sorted(messages, key=lambda m: m.get('timestamp', ''))
-    if reverse:
-        sorted_messages.reverse()
-    
-    # Filter messages by user if specified
+    # Filter messages by user if specified, matching against each distinct author once
     if filter_user:
-        filtered_messages = []
-        for message in sorted_messages:
-            author = message.get('author', {})
-            global_name = (author.get('global_name') or '').lower()
-            username = (author.get('username') or '').lower()
-            
-            if filter_user.lower() in global_name or filter_user.lower() in username:
-                filtered_messages.append(message)
-        sorted_messages = filtered_messages
+        author_index = load_author_index("messages.json", sorted_messages)
+        positions = sorted(itertools.chain.from_iterable(
+            author_positions for (global_name, username), author_positions in author_index.items()
+            if filter_user in (global_name or '').lower() or filter_user in (username or '').lower()
+        ))
+        sorted_messages = [sorted_messages[i] for i in positions]
     
-    # Filter messages by search term if specified
+    # Search, reverse and limit in a single lazy pass; the list is already in order,
+    # so the search stops as soon as `limit` messages have matched
+    selected = reversed(sorted_messages) if reverse else iter(sorted_messages)
     if search_term:
-        search_messages = []
-        for message in sorted_messages:
-            content = (message.get('content') or '').lower()
-            if search_term.lower() in content:
-                search_messages.append(message)
-        sorted_messages = search_messages
-    
-    # Limit the number of messages if specified
+        selected = (message for message in selected
+                    if search_term in (message.get('content') or '').lower())
     if limit and limit > 0:
-        sorted_messages = sorted_messages[:limit]
+        selected = itertools.islice(selected, limit)
+    sorted_messages = list(selected)
     
     total_messages = len(sorted_messages)
     
     # Calculate and display estimated completion time - ONLY IN CONSOLE
-    expected_rate = 4.0  # Expected messages per second
+    expected_rate = float(MAX_RATE)  # Expected messages per second
     estimated_seconds = total_messages / expected_rate
     estimated_time = datetime.timedelta(seconds=estimated_seconds)
     estimated_completion = datetime.datetime.now() + estimated_time
@@ -291,57 +688,13 @@ async def post_command(ctx, limit: int = None, *, options: str = ""):
     print(f"Estimated time to completion: {str(estimated_time).split('.')[0]}")
     print(f"Expected to finish at: {estimated_completion.strftime('%H:%M:%S')}")
     
-    # Post messages individually with delay to avoid rate limits
-    start_time = datetime.datetime.now()
-    last_update_time = start_time
-    
-    for i, msg in enumerate(sorted_messages):
-        # Format the message
-        author = msg.get('author', {})
-        author_name = author.get('global_name') or author.get('username') or 'Unknown User'
-        content = msg.get('content', '')
-        timestamp = format_timestamp(msg.get('timestamp', ''))
-        
-        # Create message text in the specified format
-        msg_text = f"[{timestamp}] {author_name}: {content}"
-        
-        # Send message
-        try:
-            await ctx.send(msg_text[:2000])  # Discord has a 2000 character limit
-            
-            # Update time estimates more frequently - every message multiple of 20 or every 30 seconds
-            current_time = datetime.datetime.now()
-            time_since_update = (current_time - last_update_time).total_seconds()
-            
-            if (i + 1) % 20 == 0 or i == total_messages - 1 or time_since_update >= 30:
-                progress = i + 1
-                elapsed = (current_time - start_time).total_seconds()
-                rate = progress / elapsed if elapsed > 0 else 0
-                percentage = (progress / total_messages) * 100
-                
-                # Update time estimates
-                remaining_messages = total_messages - progress
-                remaining_time = remaining_messages / rate if rate > 0 else 0
-                new_eta = datetime.datetime.now() + datetime.timedelta(seconds=remaining_time)
-                
-                # Only print to console, don't send to Discord
-                print(f"Posted {progress}/{total_messages} messages ({percentage:.1f}%, {rate:.1f} msgs/sec)")
-                print(f"Estimated time remaining: {str(datetime.timedelta(seconds=int(remaining_time))).split('.')[0]}")
-                print(f"New ETA: {new_eta.strftime('%H:%M:%S')}")
-                
-                # Update the last update time
-                last_update_time = current_time
-            
-            # Add delay to avoid rate limits
-            await asyncio.sleep(DELAY_BETWEEN_MESSAGES)
-            
-        except Exception as e:
-            print(f"❌ Error posting message: {str(e)}")
-            await asyncio.sleep(1)  # Longer delay if there's an error
+    # Post messages in order, paced to MAX_RATE per second
+    start_time = time.monotonic()
+    texts = [format_message(msg) for msg in sorted_messages]
+    await send_messages(ctx, texts)
     
     # All messages have been sent
-    end_time = datetime.datetime.now()
-    elapsed = (end_time - start_time).total_seconds()
+    elapsed = time.monotonic() - start_time
     print(f"✅ Finished posting {len(sorted_messages)} messages in {elapsed:.2f} seconds.")
     
     # Only send a simple completion message
@@ -362,27 +715,57 @@ async def reverse_command(ctx, limit: int = None):
     """Post messages in reverse order (newest first)."""
     await post_command(ctx, limit, options="reverse")
 
+async def _delete_one(message, sem: asyncio.Semaphore) -> bool:
+    """Delete a single message, returning whether it was deleted."""
+    async with sem:
+        try:
+            await message.delete()
+            return True
+        except discord.errors.Forbidden:
+            raise
+        except discord.errors.HTTPException as e:
+            print(f"Error deleting message: {e}")
+            return False
+
+async def delete_bot_messages(channel, limit: int = 500) -> int:
+    """
+    Delete this bot's messages among the last `limit` messages in a channel.
+    Returns the number of messages that were deleted.
+    """
+    my_id = bot.user.id
+    to_delete = [message async for message in channel.history(limit=limit) if message.author.id == my_id]
+    
+    # Messages younger than 14 days can be bulk deleted, 100 at a time
+    cutoff = discord.utils.utcnow() - datetime.timedelta(days=14)
+    recent = [message for message in to_delete if message.created_at > cutoff]
+    singles = [message for message in to_delete if message.created_at <= cutoff]
+    deleted_count = 0
+    
+    for offset in range(0, len(recent), 100):
+        chunk = recent[offset:offset + 100]
+        try:
+            await channel.delete_messages(chunk)
+            deleted_count += len(chunk)
+        except discord.errors.HTTPException:
+            # Bulk delete needs Manage Messages, so fall back to deleting one by one
+            singles.extend(chunk)
+    
+    # Delete the rest individually with a few requests in flight
+    sem = asyncio.Semaphore(BATCH_SIZE)
+    results = await asyncio.gather(*(_delete_one(message, sem) for message in singles))
+    return deleted_count + sum(results)
+
 @bot.command(name="clean")
 async def clean_command(ctx):
     """Clean up previous messages sent by this bot in the channel."""
     await ctx.send("🧹 Cleaning up previous messages from this bot...")
     
-    deleted_count = 0
-    start_time = datetime.datetime.now()
+    start_time = time.monotonic()
     
     try:
-        async for message in ctx.channel.history(limit=500):
-            # Only delete messages from this bot
-            if message.author.id == bot.user.id:
-                await message.delete()
-                deleted_count += 1
-                
-                # Add a small delay to prevent rate limiting
-                if deleted_count % 5 == 0:
-                    await asyncio.sleep(1)
-                    await ctx.send(f"Deleted {deleted_count} messages...", delete_after=2)
+        deleted_count = await delete_bot_messages(ctx.channel)
         
-        elapsed = (datetime.datetime.now() - start_time).total_seconds()
+        elapsed = time.monotonic() - start_time
         await ctx.send(f"✅ Cleanup complete! Deleted {deleted_count} messages in {elapsed:.2f} seconds.")
     
     except discord.errors.Forbidden:
@@ -404,52 +787,58 @@ async def deleteall_command(ctx):
     except asyncio.TimeoutError:
         await confirmation.edit(content="Operation cancelled. No messages were deleted.")
         
+async def fetch_history_page(channel, before=None):
+    """Fetch up to 100 messages from a channel, newest first."""
+    return [message async for message in channel.history(limit=100, before=before)]
+
+async def delete_message_page(channel, messages) -> int:
+    """Delete a page of messages, returning how many were deleted."""
+    deleted_count = 0
+    
+    # If more than one message, use bulk delete
+    if len(messages) > 1 and (discord.utils.utcnow() - messages[-1].created_at).days < 14:
+        try:
+            await channel.delete_messages(messages)
+            return len(messages)
+        except discord.errors.HTTPException:
+            # If bulk delete fails, fall through and delete one by one
+            pass
+    
+    # Delete one by one for older messages
+    for message in messages:
+        try:
+            await message.delete()
+            deleted_count += 1
+            await asyncio.sleep(0.5)  # Avoid rate limits
+        except:
+            pass
+    
+    return deleted_count
+
 async def delete_all_channel_messages(channel):
     """Delete all messages in a channel."""
     try:
         await channel.send("🧹 Deleting ALL messages in this channel...")
         deleted_count = 0
-        start_time = datetime.datetime.now()
+        start_time = time.monotonic()
         
-        # Delete messages in chunks to avoid rate limits
-        while True:
-            messages = []
-            async for message in channel.history(limit=100):
-                messages.append(message)
-                
-            if not messages:
-                break
-                
-            # If more than one message, use bulk delete
-            if len(messages) > 1 and (datetime.datetime.now() - messages[-1].created_at).days < 14:
-                try:
-                    await channel.delete_messages(messages)
-                    deleted_count += len(messages)
-                    await asyncio.sleep(1)  # Avoid rate limits
-                except discord.errors.HTTPException:
-                    # If bulk delete fails, delete one by one
-                    for message in messages:
-                        try:
-                            await message.delete()
-                            deleted_count += 1
-                            await asyncio.sleep(0.5)  # Avoid rate limits
-                        except:
-                            pass
-            else:
-                # Delete one by one for older messages
-                for message in messages:
-                    try:
-                        await message.delete()
-                        deleted_count += 1
-                        await asyncio.sleep(0.5)  # Avoid rate limits
-                    except:
-                        pass
+        # Delete messages page by page, fetching the next page while the current one is deleted
+        messages = await fetch_history_page(channel)
+        while messages:
+            next_page = asyncio.create_task(fetch_history_page(channel, before=messages[-1]))
+            try:
+                deleted_count += await delete_message_page(channel, messages)
+            except BaseException:
+                next_page.cancel()
+                raise
+            messages = await next_page
             
             # Provide status update
-            elapsed = (datetime.datetime.now() - start_time).total_seconds()
-            print(f"Deleted {deleted_count} messages... ({deleted_count/elapsed:.1f} msgs/sec)")
+            elapsed = time.monotonic() - start_time
+            rate = deleted_count / elapsed if elapsed > 0 else 0
+            print(f"Deleted {deleted_count} messages... ({rate:.1f} msgs/sec)")
         
-        elapsed = (datetime.datetime.now() - start_time).total_seconds()
+        elapsed = time.monotonic() - start_time
         await channel.send(f"✅ Finished deleting {deleted_count} messages in {elapsed:.2f} seconds.")
         
     except discord.errors.Forbidden:
@@ -463,24 +852,12 @@ async def auto_post_messages(channel, clean=False, limit=None, reverse=False):
     if clean:
         print("Cleaning up previous messages from this bot...")
         
-        deleted_count = 0
-        start_time = datetime.datetime.now()
+        start_time = time.monotonic()
         
         try:
-            async for message in channel.history(limit=500):
-                # Only delete messages from this bot
-                if message.author.id == bot.user.id:
-                    await message.delete()
-                    deleted_count += 1
-                    
-                    # Add a small delay to prevent rate limiting
-                    if deleted_count % 5 == 0:
-                        await asyncio.sleep(1)
-                        elapsed = (datetime.datetime.now() - start_time).total_seconds()
-                        rate = deleted_count / elapsed if elapsed > 0 else 0
-                        print(f"Deleted {deleted_count} messages... ({rate:.1f} msgs/sec)")
+            deleted_count = await delete_bot_messages(channel)
             
-            elapsed = (datetime.datetime.now() - start_time).total_seconds()
+            elapsed = time.monotonic() - start_time
             print(f"Cleanup complete! Deleted {deleted_count} messages in {elapsed:.2f} seconds.")
             
             # Add a small delay after cleanup to ensure Discord's cache updates
@@ -493,25 +870,23 @@ async def auto_post_messages(channel, clean=False, limit=None, reverse=False):
     
     # Load messages from the JSON file
     print("Loading messages from messages.json...")
-    messages = load_messages("messages.json")
+    sorted_messages = load_sorted_messages("messages.json")
     
-    if not messages:
+    if not sorted_messages:
         print("No messages found in messages.json or error loading file.")
         return
     
-    # Sort messages by timestamp
-    sorted_messages = sorted(messages, key=lambda m: m.get('timestamp', ''))
-    if reverse:
-        sorted_messages.reverse()
-    
-    # Apply limit if specified
+    # Messages come back sorted by timestamp; the cached list must not be reversed in place,
+    # and only the first `limit` messages are copied
+    selected = reversed(sorted_messages) if reverse else iter(sorted_messages)
     if limit and limit > 0:
-        sorted_messages = sorted_messages[:limit]
+        selected = itertools.islice(selected, limit)
+    sorted_messages = list(selected)
     
     total_messages = len(sorted_messages)
     
     # Calculate and display estimated completion time
-    expected_rate = 4.0  # Expected messages per second based on our delay settings
+    expected_rate = float(MAX_RATE)  # Expected messages per second based on the send pacing
     estimated_seconds = total_messages / expected_rate
     estimated_time = datetime.timedelta(seconds=estimated_seconds)
     estimated_completion = datetime.datetime.now() + estimated_time
@@ -528,87 +903,44 @@ async def auto_post_messages(channel, clean=False, limit=None, reverse=False):
         print(f"Error: Could not send messages to this channel. {e}")
         return
     
-    # Process messages individually with controlled delays
-    start_time = datetime.datetime.now()
-    last_update_time = start_time
-    
-    for i, msg in enumerate(sorted_messages):
-        # Format the message
-        author = msg.get('author', {})
-        author_name = author.get('global_name') or author.get('username') or 'Unknown User'
-        content = msg.get('content', '')
-        timestamp = format_timestamp(msg.get('timestamp', ''))
-        
-        # Create message text exactly as requested
-        msg_text = f"[{timestamp}] {author_name}: {content}"
-        
-        # Send message with error handling
-        try:
-            await channel.send(msg_text[:2000])  # Discord has a 2000 character limit
-            
-            # Update time estimates more frequently - every message multiple of 20 or every 30 seconds
-            current_time = datetime.datetime.now()
-            time_since_update = (current_time - last_update_time).total_seconds()
-            
-            if (i + 1) % 20 == 0 or i == total_messages - 1 or time_since_update >= 30:
-                progress = i + 1
-                elapsed = (current_time - start_time).total_seconds()
-                rate = progress / elapsed if elapsed > 0 else 0
-                percentage = (progress / total_messages) * 100
-                
-                # Update time estimates
-                remaining_messages = total_messages - progress
-                remaining_time = remaining_messages / rate if rate > 0 else 0
-                new_eta = datetime.datetime.now() + datetime.timedelta(seconds=remaining_time)
-                
-                # Only print to console, don't send to Discord
-                print(f"Posted {progress}/{total_messages} messages ({percentage:.1f}%, {rate:.1f} msgs/sec)")
-                print(f"Estimated time remaining: {str(datetime.timedelta(seconds=int(remaining_time))).split('.')[0]}")
-                print(f"New ETA: {new_eta.strftime('%H:%M:%S')}")
-                
-                # Update the last update time
-                last_update_time = current_time
-            
-            # Add small delay between messages to avoid rate limits
-            await asyncio.sleep(DELAY_BETWEEN_MESSAGES)
-            
-        except discord.errors.HTTPException as e:
-            # If we hit a rate limit, wait longer
-            if e.status == 429:
-                print(f"Rate limited. Waiting 2 seconds...")
-                await asyncio.sleep(2)
-                # Try again
-                try:
-                    await channel.send(msg_text[:2000])
-                except:
-                    print(f"Failed to send message after retry: {msg_text[:50]}...")
-            else:
-                print(f"HTTP error: {e}")
-                await asyncio.sleep(1)
-                
-        except Exception as e:
-            print(f"Error posting message: {e}")
-            await asyncio.sleep(1)
+    # Process messages in order, paced to MAX_RATE per second
+    start_time = time.monotonic()
+    texts = [format_message(msg) for msg in sorted_messages]
+    await send_messages(channel, texts)
     
     # All messages have been sent
-    end_time = datetime.datetime.now()
-    elapsed = (end_time - start_time).total_seconds()
+    elapsed = time.monotonic() - start_time
     print(f"✅ Finished posting all {total_messages} messages in {elapsed:.2f} seconds.")
     print(f"Average rate: {total_messages/elapsed:.2f} messages per second")
     
     # Send completion message that will disappear after 30 seconds
     await channel.send(f"✅ Finished posting {total_messages} messages from messages.json", delete_after=30)
 
+def ask(prompt: str) -> str:
+    """
+    Prompt on stdout and read one stripped line from stdin.
+    Raises EOFError when stdin is closed, like input().
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.strip()
+
 def setup_bot():
     """Set up the bot configuration."""
     config = load_config()
     
-    if 'token' not in config or config['token'] == "YOUR_BOT_TOKEN_HERE":
-        print("\n========== DISCORD BOT TOKEN SETUP ==========")
-        print("Bot token not found in config.json or needs to be updated.")
-        print("You can get a token from https://discord.com/developers/applications")
-        print("Be sure to enable all Privileged Gateway Intents in the Bot settings!")
-        token = input("Please enter your Discord bot token: ").strip()
+    if not config.get('token') or config['token'] == "YOUR_BOT_TOKEN_HERE":
+        token = ask("\n========== DISCORD BOT TOKEN SETUP ==========\n"
+                    "Bot token not found in config.json or needs to be updated.\n"
+                    "You can get a token from https://discord.com/developers/applications\n"
+                    "Be sure to enable all Privileged Gateway Intents in the Bot settings!\n"
+                    "Please enter your Discord bot token: ")
+        if not token:
+            print("No token entered, config.json was not changed.")
+            return config
         config['token'] = token
         save_config(config)
         print("Token saved to config.json")
@@ -618,50 +950,51 @@ def setup_bot():
 
 async def process_json_file(args):
     """Process a JSON file directly without Discord."""
-    # Load messages
-    messages = load_messages(args.file)
+    if ijson is not None and (args.user or args.search):
+        # Stream the export and filter it in batches, so only matching messages stay in memory
+        messages = []
+        loaded_count = 0
+        stream = iter_messages(args.file)
+        try:
+            while True:
+                batch = list(itertools.islice(stream, STREAM_BATCH_SIZE))
+                if not batch:
+                    break
+                loaded_count += len(batch)
+                messages.extend(filter_messages(batch, args.user, args.search))
+        except ijson.JSONError as e:
+            # Treat a broken export like a failed load rather than showing a partial result
+            print(f"Error decoding JSON: {str(e)}")
+            messages = []
+            loaded_count = 0
+    else:
+        # Load messages
+        messages = load_messages(args.file)
+        loaded_count = len(messages)
+        messages = filter_messages(messages, args.user, args.search)
     
-    if not messages:
+    if not loaded_count:
         print("No messages found or error loading messages.")
         return
     
-    # Sort messages by timestamp
-    sorted_messages = sorted(messages, key=lambda m: m.get('timestamp', ''))
-    if args.reverse:
-        sorted_messages.reverse()
-    
-    # Filter messages by user if specified
-    if args.user:
-        user_lower = args.user.lower()
-        filtered_messages = []
-        for message in sorted_messages:
-            author = message.get('author', {})
-            global_name = (author.get('global_name') or '').lower()
-            username = (author.get('username') or '').lower()
-            
-            if user_lower in global_name or user_lower in username:
-                filtered_messages.append(message)
-        sorted_messages = filtered_messages
-    
-    # Filter messages by search term if specified
-    if args.search:
-        search_lower = args.search.lower()
-        search_messages = []
-        for message in sorted_messages:
-            content = (message.get('content') or '').lower()
-            if search_lower in content:
-                search_messages.append(message)
-        sorted_messages = search_messages
-    
-    # Limit the number of messages if specified
+    # Sort messages by timestamp; the loaded list is cached, so never reverse it in place
     if args.limit and args.limit > 0:
-        sorted_messages = sorted_messages[:args.limit]
+        # Only the first `limit` messages are shown, so select them instead of sorting everything.
+        # Scanning in reverse keeps equal timestamps in the same order as sort-then-reverse.
+        if args.reverse:
+            sorted_messages = heapq.nlargest(args.limit, reversed(messages), key=_timestamp_key)
+        else:
+            sorted_messages = heapq.nsmallest(args.limit, messages, key=_timestamp_key)
+    else:
+        sorted_messages = sort_by_timestamp(messages)
+        if args.reverse:
+            sorted_messages = sorted_messages[::-1]
     
     # Set up output file if specified
     output_file = None
     if args.output:
         try:
-            output_file = open(args.output, 'w', encoding='utf-8')
+            output_file = open(args.output, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE)
         except Exception as e:
             print(f"Error opening output file: {str(e)}")
             return
@@ -676,9 +1009,24 @@ async def process_json_file(args):
         print(f"Limited to {args.limit} messages", file=output_file)
     print("-" * args.width, file=output_file)
     
-    # Print all messages
-    for message in sorted_messages:
-        print_message(message, width=args.width, file=output_file)
+    # Print all messages, joining several rendered messages into each write
+    out = output_file or sys.stdout
+    workers = os.cpu_count() or 1
+    written = 0
+    if workers > 1 and len(sorted_messages) >= PARALLEL_RENDER_MIN:
+        # Render large exports in worker processes; map() hands chunks back in order
+        chunks = [sorted_messages[i:i + RENDER_CHUNK_SIZE] for i in range(0, len(sorted_messages), RENDER_CHUNK_SIZE)]
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for rendered in executor.map(_render_chunk, chunks, itertools.repeat(args.width)):
+                    out.write(rendered)
+                    written += RENDER_CHUNK_SIZE
+        except (OSError, BrokenProcessPool) as e:
+            # The pool couldn't start (e.g. no /dev/shm) or a worker died; render the rest here
+            print(f"Parallel rendering failed ({e}), continuing in a single process.", file=sys.stderr)
+    
+    for offset in range(written, len(sorted_messages), MESSAGES_PER_WRITE):
+        out.write(_render_chunk(sorted_messages[offset:offset + MESSAGES_PER_WRITE], args.width))
     
     # Close output file if opened
     if output_file:
@@ -709,7 +1057,7 @@ def main():
     local_parser.add_argument('--search', '-s', help='Search for messages containing specific text')
     
     # Interactive mode
-    interactive_parser = subparsers.add_parser('interactive', help='Run the interactive bot with commands')
+    subparsers.add_parser('interactive', help='Run the interactive bot with commands')
     
     args = parser.parse_args()
     
@@ -724,7 +1072,7 @@ def main():
         # Run the interactive bot
         config = setup_bot()
         
-        if 'token' not in config:
+        if not config.get('token'):
             print("Error: Bot token not found and not provided.")
             return
         
@@ -758,58 +1106,54 @@ def main():
         # Setup bot configuration
         config = setup_bot()
         
-        # Check for token in args or config
-        if hasattr(args, 'token') and args.token:
+        # Check for token in args or config; only rewrite config.json when it changes
+        if args.token and config.get('token') != args.token:
             config['token'] = args.token
             save_config(config)
         
-        if 'token' not in config:
+        if not config.get('token'):
             print("Error: Bot token not found and not provided.")
             return
         
         # Setup auto-post parameters
-        bot.auto_post_channel_id = args.channel if hasattr(args, 'channel') and args.channel else None
-        bot.auto_post_clean = args.clean if hasattr(args, 'clean') and args.clean else False
-        bot.auto_post_limit = args.limit if hasattr(args, 'limit') and args.limit else None
-        bot.auto_post_reverse = args.reverse if hasattr(args, 'reverse') and args.reverse else False
-        bot.delete_all_messages = args.deleteall if hasattr(args, 'deleteall') and args.deleteall else False
+        bot.auto_post_channel_id = args.channel or None
+        bot.auto_post_clean = args.clean
+        bot.auto_post_limit = args.limit or None
+        bot.auto_post_reverse = args.reverse
+        bot.delete_all_messages = args.deleteall
         
         # Get channel ID from command line or ask user
         if not bot.auto_post_channel_id:
-            print("IMPORTANT: You need to enter a CHANNEL ID, not a server/guild ID.")
-            channel_id_input = input("Enter the ID of the channel to post messages to: ").strip()
+            channel_id_input = ask("IMPORTANT: You need to enter a CHANNEL ID, not a server/guild ID.\n"
+                                   "Enter the ID of the channel to post messages to: ")
             try:
                 bot.auto_post_channel_id = int(channel_id_input)
             except ValueError:
                 print("Invalid channel ID. Please enter a numeric ID.")
                 return
         
-        # Ask about cleaning up messages
-        if not hasattr(args, 'clean') or (not args.clean and not args.clean == False):
-            clean_input = input("Do you want to delete previous messages sent by this bot? (y/n): ").strip().lower()
-            bot.auto_post_clean = clean_input.startswith('y')
-            
         # Ask about deleting ALL messages
         if not bot.delete_all_messages:
-            delete_all_input = input("Do you want to delete ALL messages in the channel before posting? (y/n): ").strip().lower()
+            delete_all_input = ask("Do you want to delete ALL messages in the channel before posting? (y/n): ").lower()
             bot.delete_all_messages = delete_all_input.startswith('y')
             if bot.delete_all_messages:
-                confirm = input("⚠️ WARNING: This will delete ALL messages in the channel. Type 'yes' to confirm: ").strip().lower()
+                confirm = ask("⚠️ WARNING: This will delete ALL messages in the channel. Type 'yes' to confirm: ").lower()
                 if confirm != 'yes':
                     print("Operation cancelled.")
                     bot.delete_all_messages = False
         
-        print("\n============== STARTING DISCORD EXPORT BOT ==============")
-        print(f"Reading messages from: {args.file}")
-        if hasattr(args, 'limit') and args.limit:
-            print(f"Limited to {args.limit} messages")
-        if hasattr(args, 'reverse') and args.reverse:
-            print("Processing messages in reverse order (newest first)")
+        banner = ["\n============== STARTING DISCORD EXPORT BOT ==============",
+                  f"Reading messages from: {args.file}"]
+        if args.limit:
+            banner.append(f"Limited to {args.limit} messages")
+        if args.reverse:
+            banner.append("Processing messages in reverse order (newest first)")
         if bot.auto_post_clean:
-            print("The bot will delete its previous messages in the channel")
+            banner.append("The bot will delete its previous messages in the channel")
         if bot.delete_all_messages:
-            print("⚠️ The bot will delete ALL messages in the channel before posting")
-        print("===================================================\n")
+            banner.append("⚠️ The bot will delete ALL messages in the channel before posting")
+        banner.append("===================================================\n")
+        print('\n'.join(banner))
         
         try:
             bot.run(config['token'])